@@ -0,0 +1,54 @@
+package com.parserpotato.config;
+
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.scheduling.concurrent.ThreadPoolTaskExecutor;
+
+import java.util.concurrent.ThreadPoolExecutor;
+
+/**
+ * Executor configuration for concurrent chunk processing
+ */
+@Configuration
+public class AsyncConfig {
+
+    /**
+     * Worker pool for upload chunk processing. Parsing stays on the request
+     * thread while validated chunks load into the database on these workers,
+     * so parse and DB time overlap instead of serializing.
+     */
+    @Bean(name = "uploadExecutor")
+    public ThreadPoolTaskExecutor uploadExecutor() {
+        // Chunk processing is a mix of CPU-bound validation and DB waits, so
+        // size the pool to the host rather than a fixed count; the floor
+        // keeps parse/load overlap on small containers
+        int workers = Math.max(2, Runtime.getRuntime().availableProcessors());
+
+        ThreadPoolTaskExecutor executor = new ThreadPoolTaskExecutor();
+        executor.setCorePoolSize(workers);
+        executor.setMaxPoolSize(workers);
+        // Bounded queue + caller-runs gives natural backpressure: once the
+        // workers and queue are full, the parsing thread processes the next
+        // chunk itself instead of buffering unbounded chunks in memory
+        executor.setQueueCapacity(workers);
+        executor.setRejectedExecutionHandler(new ThreadPoolExecutor.CallerRunsPolicy());
+        executor.setThreadNamePrefix("upload-");
+        executor.initialize();
+        return executor;
+    }
+
+    /**
+     * Separate pool for per-table loads fanned out from within a chunk task.
+     * Kept distinct from uploadExecutor so chunk tasks waiting on their
+     * table subtasks can never starve the threads those subtasks need.
+     */
+    @Bean(name = "tableLoadExecutor")
+    public ThreadPoolTaskExecutor tableLoadExecutor() {
+        ThreadPoolTaskExecutor executor = new ThreadPoolTaskExecutor();
+        executor.setCorePoolSize(2);
+        executor.setMaxPoolSize(2);
+        executor.setThreadNamePrefix("table-load-");
+        executor.initialize();
+        return executor;
+    }
+}
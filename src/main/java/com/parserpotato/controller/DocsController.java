@@ -15,7 +15,9 @@ import java.io.IOException;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.attribute.FileTime;
 import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
 
 /**
  * Controller for serving documentation files as HTML
@@ -36,9 +38,19 @@ public class DocsController {
     private final Parser markdownParser = Parser.builder().build();
     private final HtmlRenderer htmlRenderer = HtmlRenderer.builder().build();
 
+    /**
+     * A rendered document plus the source file's modification time
+     */
+    private record CachedDoc(FileTime lastModified, String html) {
+    }
+
+    // Rendering is a pure function of the file contents, so cache per
+    // filename and invalidate on modification time
+    private final Map<String, CachedDoc> renderCache = new ConcurrentHashMap<>();
+
     @GetMapping(value = "/{filename}", produces = MediaType.TEXT_HTML_VALUE)
     public ResponseEntity<String> getDocFile(@PathVariable String filename) {
-        log.info("Serving documentation file: {}", filename);
+        log.debug("Serving documentation file: {}", filename);
 
         // Validate filename
         if (!ALLOWED_DOCS.containsKey(filename)) {
@@ -53,9 +65,16 @@ public class DocsController {
         }
 
         try {
+            FileTime lastModified = Files.getLastModifiedTime(filePath);
+            CachedDoc cached = renderCache.get(filename);
+            if (cached != null && cached.lastModified().equals(lastModified)) {
+                return ResponseEntity.ok(cached.html());
+            }
+
             String markdown = Files.readString(filePath);
             String htmlContent = convertMarkdownToHtml(markdown);
             String styledHtml = wrapWithStyles(htmlContent, ALLOWED_DOCS.get(filename));
+            renderCache.put(filename, new CachedDoc(lastModified, styledHtml));
             return ResponseEntity.ok(styledHtml);
         } catch (IOException e) {
             log.error("Error reading documentation file: {}", filename, e);
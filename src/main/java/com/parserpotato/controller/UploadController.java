@@ -12,15 +12,22 @@ import io.swagger.v3.oas.annotations.responses.ApiResponses;
 import io.swagger.v3.oas.annotations.tags.Tag;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Qualifier;
 import org.springframework.http.HttpStatus;
 import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
 import org.springframework.web.multipart.MultipartFile;
 
+import java.util.ArrayList;
+import java.util.Iterator;
 import java.util.List;
 import java.util.Map;
-import java.util.stream.Collectors;
+import java.util.Set;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.Executor;
+import java.util.concurrent.Semaphore;
 import java.util.stream.Stream;
 
 /**
@@ -32,12 +39,57 @@ import java.util.stream.Stream;
 @Tag(name = "File Upload", description = "API for uploading and processing CSV/JSON files")
 public class UploadController {
 
+    /**
+     * Upper bound on chunks anywhere between parsed and loaded. The executor
+     * queue alone cannot bound this: a chunk waiting for a predecessor's
+     * load occupies no queue slot, so without this cap a large mixed-table
+     * file could buffer all its validated chunks in memory.
+     */
+    private static final int MAX_IN_FLIGHT_CHUNKS = 8;
+
     @Autowired
     private FileParserService fileParserService;
 
     @Autowired
     private DataLoaderService dataLoaderService;
 
+    @Autowired
+    @Qualifier("uploadExecutor")
+    private Executor uploadExecutor;
+
+    /**
+     * Verify and load one categorized chunk.
+     * Returns the four per-table insert counts plus the chunk size.
+     */
+    private int[] verifyAndLoad(DataLoaderService.CategorizedRecords categorized, int chunkSize) {
+        dataLoaderService.verifyRelationships(categorized);
+
+        // loadDataBatch reports per-table failures itself and returns the
+        // counts that actually committed, so no catch-all here that would
+        // misreport a partially loaded chunk as fully skipped
+        int[] counts = dataLoaderService.loadDataBatch(categorized);
+        return new int[] { counts[0], counts[1], counts[2], counts[3], chunkSize };
+    }
+
+    /**
+     * Track which table types this upload has produced so far
+     */
+    private static void noteTables(DataLoaderService.CategorizedRecords categorized,
+            Set<String> tablesSeen) {
+        if (!categorized.customers().isEmpty()) {
+            tablesSeen.add("customers");
+        }
+        if (!categorized.products().isEmpty()) {
+            tablesSeen.add("products");
+        }
+        if (!categorized.orders().isEmpty()) {
+            tablesSeen.add("orders");
+        }
+        if (!categorized.orderItems().isEmpty()) {
+            tablesSeen.add("order_items");
+        }
+    }
+
     @PostMapping(value = "/upload", consumes = MediaType.MULTIPART_FORM_DATA_VALUE)
     @Operation(summary = "Upload and process CSV/JSON file", description = "Upload a CSV or JSON file to parse and insert data into the database. "
             +
@@ -62,9 +114,6 @@ public class UploadController {
                                 .build());
             }
 
-            // Parse file and process in chunks
-            Stream<Map<String, String>> recordStream = fileParserService.parseFile(file);
-
             int totalRecordsProcessed = 0;
             int totalSuccessRows = 0;
             int totalSkippedRows = 0;
@@ -73,39 +122,82 @@ public class UploadController {
             int totalOrders = 0;
             int totalOrderItems = 0;
 
-            // Process in chunks
-            List<Map<String, String>> allRecords = recordStream.collect(Collectors.toList());
             int chunkSize = fileParserService.getChunkSize();
 
-            for (int i = 0; i < allRecords.size(); i += chunkSize) {
-                int end = Math.min(i + chunkSize, allRecords.size());
-                List<Map<String, String>> chunk = allRecords.subList(i, end);
-
-                dataLoaderService.clearErrors();
-
-                // Validate and categorize
-                Map<String, List<Object>> categorized = dataLoaderService.validateAndCategorize(chunk);
-
-                // Verify relationships
-                dataLoaderService.verifyRelationships(categorized);
-
-                // Load data
-                try {
-                    int[] counts = dataLoaderService.loadDataBatch(categorized);
-                    totalCustomers += counts[0];
-                    totalProducts += counts[1];
-                    totalOrders += counts[2];
-                    totalOrderItems += counts[3];
-
-                    int chunkSuccess = counts[0] + counts[1] + counts[2] + counts[3];
-                    totalSuccessRows += chunkSuccess;
-                    totalSkippedRows += (chunk.size() - chunkSuccess);
-                } catch (Exception e) {
-                    log.error("Error loading data batch", e);
-                    totalSkippedRows += chunk.size();
+            dataLoaderService.clearErrors();
+
+            // Parse and process in chunks without materializing the whole file:
+            // pull records off the stream one chunk at a time so memory stays
+            // constant regardless of upload size. Validation always runs
+            // concurrently on the upload executor so parsing overlaps DB
+            // latency. Verify/load is only concurrent while the upload has
+            // produced a single table type: once it spans types, chunk N+1
+            // may hold orders whose customers are still loading in chunk N,
+            // so each chunk's verify/load waits for its predecessor to keep
+            // FK parents committed before their dependents. The semaphore
+            // bounds chunks held anywhere in the pipeline.
+            List<CompletableFuture<int[]>> pending = new ArrayList<>();
+            Set<String> tablesSeen = ConcurrentHashMap.newKeySet();
+            Semaphore inFlight = new Semaphore(MAX_IN_FLIGHT_CHUNKS);
+            // Decisions must happen in chunk order — a later chunk deciding
+            // from only its own types could race past a predecessor that has
+            // not categorized yet — so each chunk's decision waits for the
+            // previous chunk's decision (not its load)
+            CompletableFuture<?> previousDecision = CompletableFuture.completedFuture(null);
+            // Accumulated completion of every load submitted so far; a
+            // dependent chunk must wait for all of them, since earlier
+            // single-table chunks may still be loading concurrently
+            CompletableFuture<Void> allPriorLoads = CompletableFuture.completedFuture(null);
+
+            try (Stream<List<Map<String, String>>> chunkStream = fileParserService
+                    .chunkStream(fileParserService.parseFile(file), chunkSize)) {
+                Iterator<List<Map<String, String>>> chunks = chunkStream.iterator();
+
+                while (chunks.hasNext()) {
+                    List<Map<String, String>> chunk = chunks.next();
+
+                    inFlight.acquire();
+                    CompletableFuture<Void> loadBarrier = allPriorLoads;
+                    CompletableFuture<DataLoaderService.CategorizedRecords> categorizedFuture =
+                            CompletableFuture.supplyAsync(
+                                    () -> dataLoaderService.validateAndCategorize(chunk),
+                                    uploadExecutor);
+                    // handle(): order behind the predecessor's decision
+                    // without inheriting its failure
+                    CompletableFuture<Boolean> dependentFuture = categorizedFuture.thenCombine(
+                            previousDecision.handle((r, e) -> null),
+                            (categorized, ignored) -> {
+                                noteTables(categorized, tablesSeen);
+                                return tablesSeen.size() > 1;
+                            });
+                    CompletableFuture<int[]> result = dependentFuture.thenCompose(dependent -> {
+                        if (dependent) {
+                            return loadBarrier.thenApplyAsync(
+                                    v -> verifyAndLoad(categorizedFuture.join(), chunk.size()),
+                                    uploadExecutor);
+                        }
+                        return CompletableFuture.completedFuture(
+                                verifyAndLoad(categorizedFuture.join(), chunk.size()));
+                    });
+                    result.whenComplete((r, e) -> inFlight.release());
+                    previousDecision = dependentFuture;
+                    allPriorLoads = allPriorLoads.thenCombine(
+                            result.handle((r, e) -> null), (a, b) -> null);
+                    pending.add(result);
                 }
+            }
 
-                totalRecordsProcessed += chunk.size();
+            for (CompletableFuture<int[]> future : pending) {
+                int[] counts = future.join();
+                totalCustomers += counts[0];
+                totalProducts += counts[1];
+                totalOrders += counts[2];
+                totalOrderItems += counts[3];
+
+                int chunkSuccess = counts[0] + counts[1] + counts[2] + counts[3];
+                totalSuccessRows += chunkSuccess;
+                totalSkippedRows += (counts[4] - chunkSuccess);
+                totalRecordsProcessed += counts[4];
             }
 
             List<String> allErrors = dataLoaderService.getErrors();
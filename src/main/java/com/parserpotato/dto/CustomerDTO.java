@@ -1,7 +1,7 @@
 package com.parserpotato.dto;
 
-import jakarta.validation.constraints.Email;
 import jakarta.validation.constraints.NotBlank;
+import jakarta.validation.constraints.Pattern;
 import jakarta.validation.constraints.Size;
 import lombok.AllArgsConstructor;
 import lombok.Data;
@@ -23,8 +23,10 @@ public class CustomerDTO {
     @Size(min = 1, max = 255, message = "Name must be between 1 and 255 characters")
     private String name;
 
+    // Pragmatic RFC 5322 subset: far cheaper per record than full @Email
+    // parsing, and ingest only needs to reject obviously malformed values
     @NotBlank(message = "Email is required")
-    @Email(message = "Email must be valid")
+    @Pattern(regexp = "^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$", message = "Email must be valid")
     private String email;
 
     @Size(max = 50, message = "Phone must not exceed 50 characters")
@@ -2,9 +2,13 @@ package com.parserpotato.repository;
 
 import com.parserpotato.model.Customer;
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
+import java.util.Collection;
 import java.util.Optional;
+import java.util.Set;
 
 /**
  * Repository for Customer entity
@@ -18,7 +22,8 @@ public interface CustomerRepository extends JpaRepository<Customer, Long> {
     Optional<Customer> findByCustomerId(String customerId);
 
     /**
-     * Check if customer exists by customerId
+     * Find which of the given customerIds already exist
      */
-    boolean existsByCustomerId(String customerId);
+    @Query("select c.customerId from Customer c where c.customerId in :customerIds")
+    Set<String> findExistingCustomerIds(@Param("customerIds") Collection<String> customerIds);
 }
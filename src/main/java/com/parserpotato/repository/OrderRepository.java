@@ -2,9 +2,13 @@ package com.parserpotato.repository;
 
 import com.parserpotato.model.Order;
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
+import java.util.Collection;
 import java.util.Optional;
+import java.util.Set;
 
 /**
  * Repository for Order entity
@@ -18,7 +22,8 @@ public interface OrderRepository extends JpaRepository<Order, Long> {
     Optional<Order> findByOrderId(String orderId);
 
     /**
-     * Check if order exists by orderId
+     * Find which of the given orderIds already exist
      */
-    boolean existsByOrderId(String orderId);
+    @Query("select o.orderId from Order o where o.orderId in :orderIds")
+    Set<String> findExistingOrderIds(@Param("orderIds") Collection<String> orderIds);
 }
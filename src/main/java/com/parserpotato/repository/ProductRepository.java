@@ -2,9 +2,13 @@ package com.parserpotato.repository;
 
 import com.parserpotato.model.Product;
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
+import java.util.Collection;
 import java.util.Optional;
+import java.util.Set;
 
 /**
  * Repository for Product entity
@@ -18,7 +22,8 @@ public interface ProductRepository extends JpaRepository<Product, Long> {
     Optional<Product> findByProductId(String productId);
 
     /**
-     * Check if product exists by productId
+     * Find which of the given productIds already exist
      */
-    boolean existsByProductId(String productId);
+    @Query("select p.productId from Product p where p.productId in :productIds")
+    Set<String> findExistingProductIds(@Param("productIds") Collection<String> productIds);
 }
@@ -1,19 +1,24 @@
 package com.parserpotato.service;
 
 import com.parserpotato.dto.*;
-import com.parserpotato.model.*;
 import com.parserpotato.repository.*;
 import jakarta.validation.ConstraintViolation;
 import jakarta.validation.Validator;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.scheduling.concurrent.ThreadPoolTaskExecutor;
 import org.springframework.stereotype.Service;
-import org.springframework.transaction.annotation.Transactional;
+import org.springframework.transaction.support.TransactionTemplate;
 
 import java.time.LocalDateTime;
 import java.time.format.DateTimeFormatter;
 import java.time.format.DateTimeParseException;
 import java.util.*;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.function.Function;
 
 /**
  * Service for validating and loading data into the database
@@ -26,11 +31,49 @@ public class DataLoaderService {
     private final CustomerRepository customerRepository;
     private final ProductRepository productRepository;
     private final OrderRepository orderRepository;
-    private final OrderItemRepository orderItemRepository;
     private final Validator validator;
+    private final BulkCopyService bulkCopyService;
+    private final JdbcTemplate jdbcTemplate;
+    private final TransactionTemplate transactionTemplate;
+    private final ThreadPoolTaskExecutor tableLoadExecutor;
 
-    private final List<String> errors = new ArrayList<>();
-    private int currentRow = 0;
+    @Value("${app.copy-threshold:100}")
+    private int copyThreshold;
+
+    /**
+     * Upper bound on retained error messages; the upload response truncates
+     * at the same count, so anything beyond it would only grow the heap
+     */
+    private static final int MAX_ERRORS = 100;
+
+    // Chunks may be validated/loaded concurrently, so error accumulation is
+    // synchronized; row numbers are tracked per call
+    private final List<String> errors = Collections.synchronizedList(new ArrayList<>());
+
+    /**
+     * Record an error, dropping it once the retention cap is reached
+     */
+    private void addError(String message) {
+        synchronized (errors) {
+            if (errors.size() < MAX_ERRORS) {
+                errors.add(message);
+            }
+        }
+    }
+
+    /**
+     * Retention cap for the signature cache: legitimate files carry a handful
+     * of shapes, so the cap only bites on uploads whose records deliberately
+     * vary their field sets — those keep classifying, just uncached
+     */
+    private static final int SIGNATURE_CACHE_MAX = 1024;
+
+    /**
+     * Cache of field-set signature -> table type. Records from one file share
+     * a handful of signatures, so after the first row of each shape the
+     * classification is a single hash lookup instead of a branch chain.
+     */
+    private final Map<Set<String>, String> signatureCache = new ConcurrentHashMap<>();
 
     /**
      * Identify table type based on record fields
@@ -38,6 +81,23 @@ public class DataLoaderService {
     public String identifyTableType(Map<String, String> record) {
         Set<String> fields = record.keySet();
 
+        String cached = signatureCache.get(fields);
+        if (cached != null) {
+            return cached;
+        }
+
+        String tableType = classifyFields(fields);
+        if (signatureCache.size() < SIGNATURE_CACHE_MAX) {
+            // Copy the key set so the cache does not pin the record map
+            signatureCache.put(Set.copyOf(fields), tableType);
+        }
+        return tableType;
+    }
+
+    /**
+     * Classify a field-set signature into a table type
+     */
+    private String classifyFields(Set<String> fields) {
         // Check for order_item (must check before order since both have order_id)
         if (fields.contains("product_id") && fields.contains("quantity") &&
                 fields.contains("unit_price") && fields.contains("subtotal")) {
@@ -66,61 +126,99 @@ public class DataLoaderService {
     }
 
     /**
-     * Validate and categorize records by table type
+     * A raw record paired with its row number in the chunk
      */
-    public Map<String, List<Object>> validateAndCategorize(List<Map<String, String>> records) {
-        Map<String, List<Object>> categorized = new HashMap<>();
-        categorized.put("customers", new ArrayList<>());
-        categorized.put("products", new ArrayList<>());
-        categorized.put("orders", new ArrayList<>());
-        categorized.put("order_items", new ArrayList<>());
+    private record NumberedRecord(int rowNum, Map<String, String> record) {
+    }
 
-        errors.clear();
-        currentRow = 0;
+    /**
+     * Validated DTOs of one chunk, bucketed by target table
+     */
+    public record CategorizedRecords(List<CustomerDTO> customers, List<ProductDTO> products,
+            List<OrderDTO> orders, List<OrderItemDTO> orderItems) {
+    }
+
+    /**
+     * Validate and categorize records by table type.
+     * Records are first bucketed by table type, then each bucket is mapped
+     * and validated in one batched pass per category rather than dispatching
+     * per record. Buckets stay typed end-to-end so downstream stages read
+     * DTO fields directly instead of casting per row.
+     */
+    public CategorizedRecords validateAndCategorize(List<Map<String, String>> records) {
+        // Pass 1: bucket records by table type
+        ArrayList<NumberedRecord> customerBucket = new ArrayList<>();
+        ArrayList<NumberedRecord> productBucket = new ArrayList<>();
+        ArrayList<NumberedRecord> orderBucket = new ArrayList<>();
+        ArrayList<NumberedRecord> orderItemBucket = new ArrayList<>();
+
+        // Files are usually single-table, so reserve room for the whole chunk
+        // in the first record's bucket; mixed files just leave some slack
+        if (!records.isEmpty()) {
+            switch (identifyTableType(records.get(0))) {
+                case "customer" -> customerBucket.ensureCapacity(records.size());
+                case "product" -> productBucket.ensureCapacity(records.size());
+                case "order" -> orderBucket.ensureCapacity(records.size());
+                case "order_item" -> orderItemBucket.ensureCapacity(records.size());
+                default -> {
+                }
+            }
+        }
 
+        // Consecutive records almost always share one shape, so remember the
+        // previous record's field set and skip the shared signature cache
+        // (and its hashing) while the shape holds
+        Set<String> lastFields = null;
+        String lastType = null;
+
+        int rowNum = 0;
         for (Map<String, String> record : records) {
-            currentRow++;
+            rowNum++;
+            String tableType;
+            if (record.keySet().equals(lastFields)) {
+                tableType = lastType;
+            } else {
+                tableType = identifyTableType(record);
+                lastFields = record.keySet();
+                lastType = tableType;
+            }
+            switch (tableType) {
+                case "customer" -> customerBucket.add(new NumberedRecord(rowNum, record));
+                case "product" -> productBucket.add(new NumberedRecord(rowNum, record));
+                case "order" -> orderBucket.add(new NumberedRecord(rowNum, record));
+                case "order_item" -> orderItemBucket.add(new NumberedRecord(rowNum, record));
+                default -> addError("Row " + rowNum + ": Unable to identify table type");
+            }
+        }
+
+        // Pass 2: map and validate each bucket in one batched pass. Bucket
+        // sizes are known by now, so the output lists are sized exactly once.
+        CategorizedRecords categorized = new CategorizedRecords(
+                new ArrayList<>(customerBucket.size()), new ArrayList<>(productBucket.size()),
+                new ArrayList<>(orderBucket.size()), new ArrayList<>(orderItemBucket.size()));
+        validateBucket(customerBucket, this::mapToCustomerDTO, categorized.customers());
+        validateBucket(productBucket, this::mapToProductDTO, categorized.products());
+        validateBucket(orderBucket, this::mapToOrderDTO, categorized.orders());
+        validateBucket(orderItemBucket, this::mapToOrderItemDTO, categorized.orderItems());
+
+        return categorized;
+    }
+
+    /**
+     * Map and validate one bucket of same-type records
+     */
+    private <T> void validateBucket(List<NumberedRecord> bucket,
+            Function<Map<String, String>, T> mapper, List<T> validated) {
+        for (NumberedRecord numbered : bucket) {
             try {
-                String tableType = identifyTableType(record);
-
-                switch (tableType) {
-                    case "customer":
-                        CustomerDTO customerDTO = mapToCustomerDTO(record);
-                        if (validateDTO(customerDTO, currentRow)) {
-                            categorized.get("customers").add(customerDTO);
-                        }
-                        break;
-
-                    case "product":
-                        ProductDTO productDTO = mapToProductDTO(record);
-                        if (validateDTO(productDTO, currentRow)) {
-                            categorized.get("products").add(productDTO);
-                        }
-                        break;
-
-                    case "order":
-                        OrderDTO orderDTO = mapToOrderDTO(record);
-                        if (validateDTO(orderDTO, currentRow)) {
-                            categorized.get("orders").add(orderDTO);
-                        }
-                        break;
-
-                    case "order_item":
-                        OrderItemDTO orderItemDTO = mapToOrderItemDTO(record);
-                        if (validateDTO(orderItemDTO, currentRow)) {
-                            categorized.get("order_items").add(orderItemDTO);
-                        }
-                        break;
-
-                    default:
-                        errors.add("Row " + currentRow + ": Unable to identify table type");
+                T dto = mapper.apply(numbered.record());
+                if (validateDTO(dto, numbered.rowNum())) {
+                    validated.add(dto);
                 }
             } catch (Exception e) {
-                errors.add("Row " + currentRow + ": " + e.getMessage());
+                addError("Row " + numbered.rowNum() + ": " + e.getMessage());
             }
         }
-
-        return categorized;
     }
 
     /**
@@ -131,7 +229,7 @@ public class DataLoaderService {
 
         if (!violations.isEmpty()) {
             for (ConstraintViolation<T> violation : violations) {
-                errors.add("Row " + rowNum + ": " + violation.getMessage());
+                addError("Row " + rowNum + ": " + violation.getMessage());
             }
             return false;
         }
@@ -160,7 +258,9 @@ public class DataLoaderService {
         dto.setName(record.get("name"));
         dto.setDescription(record.get("description"));
         dto.setPrice(parseDouble(record.get("price"), "price"));
-        dto.setCategory(record.get("category"));
+        // Interned for the same reason as order status: few distinct values
+        String category = record.get("category");
+        dto.setCategory(category != null ? category.intern() : null);
         dto.setStockQuantity(parseInt(record.get("stock_quantity"), 0));
         return dto;
     }
@@ -173,7 +273,10 @@ public class DataLoaderService {
         dto.setOrderId(record.get("order_id"));
         dto.setCustomerId(record.get("customer_id"));
         dto.setOrderDate(parseDateTime(record.get("order_date")));
-        dto.setStatus(record.get("status") != null ? record.get("status").toLowerCase() : null);
+        // Interned: a handful of distinct statuses repeat across millions of
+        // rows, so duplicates collapse to the shared pool copies
+        String status = record.get("status");
+        dto.setStatus(status != null ? status.toLowerCase().intern() : null);
         dto.setTotalAmount(parseDouble(record.get("total_amount"), "total_amount"));
         return dto;
     }
@@ -219,6 +322,37 @@ public class DataLoaderService {
         }
     }
 
+    /**
+     * Accepted order_date formats, most common first
+     */
+    private static final DateTimeFormatter[] DATE_TIME_FORMATTERS = {
+            DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss"),
+            DateTimeFormatter.ofPattern("yyyy-MM-dd'T'HH:mm:ss"),
+            DateTimeFormatter.ISO_DATE_TIME
+    };
+
+    /**
+     * Index of the formatter that parsed the previous value. Files use one
+     * date format throughout, so after the first row every parse hits on the
+     * first try instead of walking the formatter list via thrown exceptions.
+     * Benign race: a stale index only costs the extra attempts.
+     */
+    private volatile int lastFormatterIndex = 0;
+
+    /**
+     * Retention cap for the parsed-date cache; plenty for the distinct
+     * timestamps of typical files while bounding memory for adversarial ones
+     */
+    private static final int DATE_CACHE_MAX = 1024;
+
+    /**
+     * Cache of raw date string -> parsed value. Real files repeat timestamps
+     * heavily (orders placed the same second), so most rows resolve with one
+     * hash lookup instead of a parse. LocalDateTime is immutable, so sharing
+     * instances across rows is safe.
+     */
+    private final Map<String, LocalDateTime> dateCache = new ConcurrentHashMap<>();
+
     /**
      * Parse date time value
      */
@@ -226,77 +360,124 @@ public class DataLoaderService {
         if (value == null || value.trim().isEmpty()) {
             return null;
         }
+        String trimmed = value.trim();
+
+        LocalDateTime cached = dateCache.get(trimmed);
+        if (cached != null) {
+            return cached;
+        }
+        LocalDateTime parsed = parseDateTimeUncached(trimmed);
+        if (dateCache.size() < DATE_CACHE_MAX) {
+            dateCache.put(trimmed, parsed);
+        }
+        return parsed;
+    }
+
+    /**
+     * Parse a trimmed, non-empty date time string
+     */
+    private LocalDateTime parseDateTimeUncached(String trimmed) {
+        int last = lastFormatterIndex;
         try {
-            // Try common formats
-            DateTimeFormatter[] formatters = {
-                    DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss"),
-                    DateTimeFormatter.ofPattern("yyyy-MM-dd'T'HH:mm:ss"),
-                    DateTimeFormatter.ISO_DATE_TIME
-            };
-
-            for (DateTimeFormatter formatter : formatters) {
-                try {
-                    return LocalDateTime.parse(value.trim(), formatter);
-                } catch (DateTimeParseException ignored) {
-                }
+            return LocalDateTime.parse(trimmed, DATE_TIME_FORMATTERS[last]);
+        } catch (DateTimeParseException ignored) {
+        }
+
+        for (int i = 0; i < DATE_TIME_FORMATTERS.length; i++) {
+            if (i == last) {
+                continue;
+            }
+            try {
+                LocalDateTime parsed = LocalDateTime.parse(trimmed, DATE_TIME_FORMATTERS[i]);
+                lastFormatterIndex = i;
+                return parsed;
+            } catch (DateTimeParseException ignored) {
             }
-            throw new IllegalArgumentException("Unable to parse date: " + value);
-        } catch (Exception e) {
-            throw new IllegalArgumentException("Invalid date format: " + value);
         }
+        throw new IllegalArgumentException("Invalid date format: " + trimmed);
     }
 
     /**
-     * Verify foreign key relationships
+     * Verify foreign key relationships.
+     * Only the IDs actually referenced by this batch are fetched from the
+     * database, in one WHERE IN query per table. The three lookups are
+     * independent point-in-time reads, so they run concurrently on separate
+     * connections rather than inside one shared transaction.
      */
-    @Transactional(readOnly = true)
-    public boolean verifyRelationships(Map<String, List<Object>> categorized) {
-        // Get existing customer IDs
-        Set<String> existingCustomerIds = new HashSet<>();
-        customerRepository.findAll().forEach(c -> existingCustomerIds.add(c.getCustomerId()));
-
-        // Add newly added customers
-        categorized.get("customers").forEach(c -> {
-            CustomerDTO dto = (CustomerDTO) c;
-            existingCustomerIds.add(dto.getCustomerId());
-        });
-
-        // Get existing product IDs
-        Set<String> existingProductIds = new HashSet<>();
-        productRepository.findAll().forEach(p -> existingProductIds.add(p.getProductId()));
-
-        // Add newly added products
-        categorized.get("products").forEach(p -> {
-            ProductDTO dto = (ProductDTO) p;
-            existingProductIds.add(dto.getProductId());
-        });
-
-        // Get existing order IDs
-        Set<String> existingOrderIds = new HashSet<>();
-        orderRepository.findAll().forEach(o -> existingOrderIds.add(o.getOrderId()));
-
-        // Add newly added orders
-        categorized.get("orders").forEach(o -> {
-            OrderDTO dto = (OrderDTO) o;
-            existingOrderIds.add(dto.getOrderId());
-        });
-
-        // Verify orders reference existing customers
-        for (Object obj : categorized.get("orders")) {
-            OrderDTO dto = (OrderDTO) obj;
-            if (!existingCustomerIds.contains(dto.getCustomerId())) {
-                errors.add("Order " + dto.getOrderId() + " references non-existent customer: " + dto.getCustomerId());
+    public boolean verifyRelationships(CategorizedRecords categorized) {
+        // IDs introduced by this batch
+        Set<String> knownCustomerIds = new HashSet<>();
+        categorized.customers().forEach(c -> knownCustomerIds.add(c.getCustomerId()));
+
+        Set<String> knownProductIds = new HashSet<>();
+        categorized.products().forEach(p -> knownProductIds.add(p.getProductId()));
+
+        Set<String> knownOrderIds = new HashSet<>();
+        categorized.orders().forEach(o -> knownOrderIds.add(o.getOrderId()));
+
+        // IDs referenced by this batch but not introduced by it: resolve each
+        // set against the database in a single query
+        Set<String> customerIdsToCheck = new HashSet<>();
+        for (OrderDTO dto : categorized.orders()) {
+            if (!knownCustomerIds.contains(dto.getCustomerId())) {
+                customerIdsToCheck.add(dto.getCustomerId());
+            }
+        }
+
+        Set<String> orderIdsToCheck = new HashSet<>();
+        Set<String> productIdsToCheck = new HashSet<>();
+        for (OrderItemDTO dto : categorized.orderItems()) {
+            if (!knownOrderIds.contains(dto.getOrderId())) {
+                orderIdsToCheck.add(dto.getOrderId());
+            }
+            if (!knownProductIds.contains(dto.getProductId())) {
+                productIdsToCheck.add(dto.getProductId());
             }
         }
 
-        // Verify order items reference existing orders and products
-        for (Object obj : categorized.get("order_items")) {
-            OrderItemDTO dto = (OrderItemDTO) obj;
-            if (!existingOrderIds.contains(dto.getOrderId())) {
-                errors.add("OrderItem references non-existent order: " + dto.getOrderId());
+        // Customer and product lookups overlap on the worker pool while the
+        // order lookup runs on the calling thread, matching the fan-out used
+        // by loadDataBatch
+        CompletableFuture<Set<String>> existingCustomers = customerIdsToCheck.isEmpty()
+                ? CompletableFuture.completedFuture(Set.of())
+                : CompletableFuture.supplyAsync(
+                        () -> customerRepository.findExistingCustomerIds(customerIdsToCheck),
+                        tableLoadExecutor);
+        CompletableFuture<Set<String>> existingProducts = productIdsToCheck.isEmpty()
+                ? CompletableFuture.completedFuture(Set.of())
+                : CompletableFuture.supplyAsync(
+                        () -> productRepository.findExistingProductIds(productIdsToCheck),
+                        tableLoadExecutor);
+        if (!orderIdsToCheck.isEmpty()) {
+            knownOrderIds.addAll(orderRepository.findExistingOrderIds(orderIdsToCheck));
+        }
+        knownCustomerIds.addAll(existingCustomers.join());
+        knownProductIds.addAll(existingProducts.join());
+
+        // Whatever the database lookups did not resolve is missing. In the
+        // clean case all three differences are empty and the per-row
+        // message-formatting loops below are skipped entirely.
+        Set<String> missingCustomerIds = difference(customerIdsToCheck, knownCustomerIds);
+        Set<String> missingOrderIds = difference(orderIdsToCheck, knownOrderIds);
+        Set<String> missingProductIds = difference(productIdsToCheck, knownProductIds);
+
+        if (!missingCustomerIds.isEmpty()) {
+            for (OrderDTO dto : categorized.orders()) {
+                if (missingCustomerIds.contains(dto.getCustomerId())) {
+                    addError("Order " + dto.getOrderId() + " references non-existent customer: "
+                            + dto.getCustomerId());
+                }
             }
-            if (!existingProductIds.contains(dto.getProductId())) {
-                errors.add("OrderItem references non-existent product: " + dto.getProductId());
+        }
+
+        if (!missingOrderIds.isEmpty() || !missingProductIds.isEmpty()) {
+            for (OrderItemDTO dto : categorized.orderItems()) {
+                if (missingOrderIds.contains(dto.getOrderId())) {
+                    addError("OrderItem references non-existent order: " + dto.getOrderId());
+                }
+                if (missingProductIds.contains(dto.getProductId())) {
+                    addError("OrderItem references non-existent product: " + dto.getProductId());
+                }
             }
         }
 
@@ -304,99 +485,172 @@ public class DataLoaderService {
     }
 
     /**
-     * Load data in batch mode
+     * Elements of the first set absent from the second
      */
-    @Transactional
-    public int[] loadDataBatch(Map<String, List<Object>> categorized) {
+    private static Set<String> difference(Set<String> ids, Set<String> known) {
+        if (ids.isEmpty()) {
+            return Set.of();
+        }
+        Set<String> missing = new HashSet<>(ids);
+        missing.removeAll(known);
+        return missing;
+    }
+
+    private static final List<String> CUSTOMER_COLUMNS = List.of(
+            "customer_id", "name", "email", "phone", "address", "created_at");
+    private static final List<String> PRODUCT_COLUMNS = List.of(
+            "product_id", "name", "description", "price", "category", "stock_quantity", "created_at");
+    private static final List<String> ORDER_COLUMNS = List.of(
+            "order_id", "customer_id", "order_date", "status", "total_amount", "created_at");
+    private static final List<String> ORDER_ITEM_COLUMNS = List.of(
+            "order_id", "product_id", "quantity", "unit_price", "subtotal", "created_at");
+
+    /**
+     * Load data in batch mode.
+     * Rows are bound directly from DTOs into SQL parameters — no entity
+     * objects on the write path. Batches at or above the COPY threshold are
+     * streamed via the PostgreSQL COPY protocol; smaller batches go through
+     * a single batched prepared INSERT.
+     *
+     * Each table loads in its own transaction, so a failure partway leaves
+     * the earlier tables committed. The returned counts reflect what was
+     * actually inserted up to the failure — never all zeros for a chunk that
+     * partially landed — and the failure itself is recorded as an error.
+     */
+    public int[] loadDataBatch(CategorizedRecords categorized) {
+        LocalDateTime now = LocalDateTime.now();
+
+        // Customers
+        List<Object[]> customerRows = new ArrayList<>(categorized.customers().size());
+        for (CustomerDTO dto : categorized.customers()) {
+            customerRows.add(new Object[] { dto.getCustomerId(), dto.getName(), dto.getEmail(),
+                    dto.getPhone(), dto.getAddress(), now });
+        }
+        // Products
+        List<Object[]> productRows = new ArrayList<>(categorized.products().size());
+        for (ProductDTO dto : categorized.products()) {
+            productRows.add(new Object[] { dto.getProductId(), dto.getName(), dto.getDescription(),
+                    dto.getPrice(), dto.getCategory(), dto.getStockQuantity(), now });
+        }
+
         int customersCount = 0;
         int productsCount = 0;
         int ordersCount = 0;
         int orderItemsCount = 0;
 
-        // Insert customers
-        List<Customer> customersToSave = new ArrayList<>();
-        for (Object obj : categorized.get("customers")) {
-            CustomerDTO dto = (CustomerDTO) obj;
-            if (!customerRepository.existsByCustomerId(dto.getCustomerId())) {
-                Customer customer = new Customer();
-                customer.setCustomerId(dto.getCustomerId());
-                customer.setName(dto.getName());
-                customer.setEmail(dto.getEmail());
-                customer.setPhone(dto.getPhone());
-                customer.setAddress(dto.getAddress());
-                customersToSave.add(customer);
-            }
+        // Customers and products have no dependency on each other, so they
+        // load concurrently on separate connections; orders then order items
+        // follow sequentially to respect their foreign keys.
+        CompletableFuture<Integer> productsFuture = CompletableFuture.supplyAsync(
+                () -> insertRowsInTransaction("products", "product_id", PRODUCT_COLUMNS, productRows),
+                tableLoadExecutor);
+        boolean parentsLoaded = true;
+        try {
+            customersCount = insertRowsInTransaction("customers", "customer_id", CUSTOMER_COLUMNS,
+                    customerRows);
+        } catch (RuntimeException e) {
+            recordLoadFailure("customers", e);
+            parentsLoaded = false;
         }
-        if (!customersToSave.isEmpty()) {
-            customerRepository.saveAll(customersToSave);
-            customersCount = customersToSave.size();
-        }
-
-        // Insert products
-        List<Product> productsToSave = new ArrayList<>();
-        for (Object obj : categorized.get("products")) {
-            ProductDTO dto = (ProductDTO) obj;
-            if (!productRepository.existsByProductId(dto.getProductId())) {
-                Product product = new Product();
-                product.setProductId(dto.getProductId());
-                product.setName(dto.getName());
-                product.setDescription(dto.getDescription());
-                product.setPrice(dto.getPrice());
-                product.setCategory(dto.getCategory());
-                product.setStockQuantity(dto.getStockQuantity());
-                productsToSave.add(product);
-            }
+        try {
+            productsCount = productsFuture.join();
+        } catch (RuntimeException e) {
+            recordLoadFailure("products", e);
+            parentsLoaded = false;
         }
-        if (!productsToSave.isEmpty()) {
-            productRepository.saveAll(productsToSave);
-            productsCount = productsToSave.size();
-        }
-
-        // Insert orders
-        List<Order> ordersToSave = new ArrayList<>();
-        for (Object obj : categorized.get("orders")) {
-            OrderDTO dto = (OrderDTO) obj;
-            if (!orderRepository.existsByOrderId(dto.getOrderId())) {
-                Order order = new Order();
-                order.setOrderId(dto.getOrderId());
-                order.setCustomerId(dto.getCustomerId());
-                order.setOrderDate(dto.getOrderDate());
-                order.setStatus(dto.getStatus());
-                order.setTotalAmount(dto.getTotalAmount());
-                ordersToSave.add(order);
+
+        // Orders and order items reference the tables above; once a parent
+        // load has failed their inserts would only trip FK violations, so
+        // stop at the last consistent point and report what did commit
+        if (parentsLoaded) {
+            try {
+                List<Object[]> orderRows = new ArrayList<>(categorized.orders().size());
+                for (OrderDTO dto : categorized.orders()) {
+                    orderRows.add(new Object[] { dto.getOrderId(), dto.getCustomerId(),
+                            dto.getOrderDate(), dto.getStatus(), dto.getTotalAmount(), now });
+                }
+                ordersCount = insertRowsInTransaction("orders", "order_id", ORDER_COLUMNS, orderRows);
+
+                // Order items (no natural key, so no dedup)
+                List<Object[]> orderItemRows = new ArrayList<>(categorized.orderItems().size());
+                for (OrderItemDTO dto : categorized.orderItems()) {
+                    orderItemRows.add(new Object[] { dto.getOrderId(), dto.getProductId(),
+                            dto.getQuantity(), dto.getUnitPrice(), dto.getSubtotal(), now });
+                }
+                orderItemsCount = insertRowsInTransaction("order_items", null, ORDER_ITEM_COLUMNS,
+                        orderItemRows);
+            } catch (RuntimeException e) {
+                recordLoadFailure("orders/order_items", e);
             }
         }
-        if (!ordersToSave.isEmpty()) {
-            orderRepository.saveAll(ordersToSave);
-            ordersCount = ordersToSave.size();
-        }
 
-        // Insert order items
-        List<OrderItem> orderItemsToSave = new ArrayList<>();
-        for (Object obj : categorized.get("order_items")) {
-            OrderItemDTO dto = (OrderItemDTO) obj;
-            OrderItem orderItem = new OrderItem();
-            orderItem.setOrderId(dto.getOrderId());
-            orderItem.setProductId(dto.getProductId());
-            orderItem.setQuantity(dto.getQuantity());
-            orderItem.setUnitPrice(dto.getUnitPrice());
-            orderItem.setSubtotal(dto.getSubtotal());
-            orderItemsToSave.add(orderItem);
+        return new int[] { customersCount, productsCount, ordersCount, orderItemsCount };
+    }
+
+    /**
+     * Record a table-load failure; tables loaded before it stay committed
+     */
+    private void recordLoadFailure(String tableName, RuntimeException e) {
+        log.error("Failed to load {} batch; earlier tables in this chunk remain committed",
+                tableName, e);
+        addError("Failed to load " + tableName + " batch: " + e.getMessage());
+    }
+
+    /**
+     * Run one table load in its own transaction (required for the staging
+     * table lifecycle, and keeps parallel table loads independent)
+     */
+    private int insertRowsInTransaction(String tableName, String conflictColumn, List<String> columns,
+            List<Object[]> rows) {
+        Integer inserted = transactionTemplate.execute(
+                status -> insertRows(tableName, conflictColumn, columns, rows));
+        return inserted != null ? inserted : 0;
+    }
+
+    /**
+     * Insert rows via COPY above the threshold, a single multi-row INSERT
+     * below it. Deduplication happens server-side in both cases via
+     * ON CONFLICT DO NOTHING (through the staging table on the COPY path),
+     * which also closes the check-then-insert race a client-side presence
+     * check would leave open. Returns the number of rows actually inserted.
+     */
+    private int insertRows(String tableName, String conflictColumn, List<String> columns,
+            List<Object[]> rows) {
+        if (rows.isEmpty()) {
+            return 0;
         }
-        if (!orderItemsToSave.isEmpty()) {
-            orderItemRepository.saveAll(orderItemsToSave);
-            orderItemsCount = orderItemsToSave.size();
+        if (rows.size() >= copyThreshold) {
+            if (conflictColumn != null) {
+                return (int) bulkCopyService.copyIntoWithDedup(tableName, conflictColumn, columns, rows);
+            }
+            return (int) bulkCopyService.copyInto(tableName, columns, rows);
         }
 
-        return new int[] { customersCount, productsCount, ordersCount, orderItemsCount };
+        String rowPlaceholders = "(" + String.join(", ", Collections.nCopies(columns.size(), "?")) + ")";
+        StringBuilder sql = new StringBuilder("INSERT INTO ").append(tableName)
+                .append(" (").append(String.join(", ", columns)).append(") VALUES ")
+                .append(String.join(", ", Collections.nCopies(rows.size(), rowPlaceholders)));
+        if (conflictColumn != null) {
+            sql.append(" ON CONFLICT (").append(conflictColumn).append(") DO NOTHING");
+        }
+
+        Object[] params = new Object[rows.size() * columns.size()];
+        int i = 0;
+        for (Object[] row : rows) {
+            for (Object value : row) {
+                params[i++] = value;
+            }
+        }
+        return jdbcTemplate.update(sql.toString(), params);
     }
 
     public List<String> getErrors() {
-        return new ArrayList<>(errors);
+        synchronized (errors) {
+            return new ArrayList<>(errors);
+        }
     }
 
     public void clearErrors() {
         errors.clear();
-        currentRow = 0;
     }
 }
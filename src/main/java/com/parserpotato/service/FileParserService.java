@@ -1,6 +1,8 @@
 package com.parserpotato.service;
 
-import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.core.JsonParser;
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.MappingIterator;
 import com.fasterxml.jackson.databind.ObjectMapper;
 import lombok.extern.slf4j.Slf4j;
 import org.apache.commons.csv.CSVFormat;
@@ -10,10 +12,13 @@ import org.springframework.beans.factory.annotation.Value;
 import org.springframework.stereotype.Service;
 import org.springframework.web.multipart.MultipartFile;
 
+import java.io.BufferedInputStream;
 import java.io.BufferedReader;
 import java.io.IOException;
 import java.io.InputStreamReader;
 import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
 import java.util.*;
 import java.util.stream.Stream;
 import java.util.stream.StreamSupport;
@@ -25,7 +30,13 @@ import java.util.stream.StreamSupport;
 @Slf4j
 public class FileParserService {
 
-    @Value("${app.chunk-size:1000}")
+    /**
+     * Read buffer for the temp-file spool path; 64KB halves syscall count
+     * versus the 8KB reader default on large files
+     */
+    private static final int SPOOL_READ_BUFFER_SIZE = 1 << 16;
+
+    @Value("${app.chunk-size:5000}")
     private int chunkSize;
 
     private final ObjectMapper objectMapper = new ObjectMapper();
@@ -53,22 +64,37 @@ public class FileParserService {
      * Parse CSV file in streaming mode
      * Returns a stream of maps representing each record
      */
-    public Stream<Map<String, String>> parseCsvStream(MultipartFile file) throws IOException {
-        log.info("Parsing CSV file: {}", file.getOriginalFilename());
-
+    public Stream<Map<String, String>> parseCsvStream(Path source) throws IOException {
         BufferedReader reader = new BufferedReader(
-                new InputStreamReader(file.getInputStream(), StandardCharsets.UTF_8));
+                new InputStreamReader(Files.newInputStream(source), StandardCharsets.UTF_8),
+                SPOOL_READ_BUFFER_SIZE);
 
-        CSVParser csvParser = new CSVParser(reader, CSVFormat.DEFAULT
-                .builder()
-                .setHeader()
-                .setSkipHeaderRecord(true)
-                .setTrim(true)
-                .setIgnoreEmptyLines(true)
-                .build());
+        CSVParser csvParser;
+        List<String> headers;
+        try {
+            csvParser = new CSVParser(reader, CSVFormat.DEFAULT
+                    .builder()
+                    .setHeader()
+                    .setSkipHeaderRecord(true)
+                    .setTrim(true)
+                    .setIgnoreEmptyLines(true)
+                    .build());
+
+            // Clean the header names once so each record maps by index instead
+            // of building an intermediate map per row. Interning lets the
+            // record maps share one key instance per column across all rows.
+            headers = new ArrayList<>();
+            for (String header : csvParser.getHeaderNames()) {
+                String cleaned = header != null ? header.trim() : "";
+                headers.add(cleaned.isEmpty() ? null : cleaned.intern());
+            }
+        } catch (IOException | RuntimeException e) {
+            reader.close();
+            throw e;
+        }
 
         return StreamSupport.stream(csvParser.spliterator(), false)
-                .map(this::csvRecordToMap)
+                .map(record -> csvRecordToMap(headers, record))
                 .onClose(() -> {
                     try {
                         csvParser.close();
@@ -80,131 +106,159 @@ public class FileParserService {
     }
 
     /**
-     * Convert CSVRecord to Map
+     * Convert CSVRecord to Map using the precomputed header names
      */
-    private Map<String, String> csvRecordToMap(CSVRecord record) {
-        Map<String, String> map = new HashMap<>();
-        record.toMap().forEach((key, value) -> {
-            if (key != null && !key.trim().isEmpty()) {
-                map.put(key.trim(), value != null && !value.trim().isEmpty() ? value.trim() : null);
+    private Map<String, String> csvRecordToMap(List<String> headers, CSVRecord record) {
+        Map<String, String> map = new HashMap<>(headers.size() * 2);
+        int columns = Math.min(headers.size(), record.size());
+        for (int i = 0; i < columns; i++) {
+            String key = headers.get(i);
+            if (key == null) {
+                continue;
             }
-        });
+            // Values arrive already trimmed (CSVFormat setTrim), so empty
+            // means blank field
+            String value = record.get(i);
+            map.put(key, value != null && !value.isEmpty() ? value : null);
+        }
         return map;
     }
 
     /**
      * Parse JSON file in streaming mode
-     * Supports both JSON arrays and NDJSON (newline-delimited JSON)
+     * Supports JSON arrays, single objects and NDJSON (newline-delimited JSON)
      */
-    public Stream<Map<String, String>> parseJsonStream(MultipartFile file) throws IOException {
-        log.info("Parsing JSON file: {}", file.getOriginalFilename());
-
-        BufferedReader reader = new BufferedReader(
-                new InputStreamReader(file.getInputStream(), StandardCharsets.UTF_8));
-
-        // Try to parse as JSON array first
+    public Stream<Map<String, String>> parseJsonStream(Path source) throws IOException {
+        // MappingIterator walks array elements for a root array and successive
+        // root-level values for NDJSON, so both formats stream incrementally
+        // through one code path without buffering the whole document. Records
+        // bind straight to plain maps — no intermediate JsonNode tree per row.
+        JsonParser jsonParser = objectMapper.getFactory().createParser(
+                new BufferedInputStream(Files.newInputStream(source), SPOOL_READ_BUFFER_SIZE));
+        MappingIterator<Object> values;
         try {
-            JsonNode rootNode = objectMapper.readTree(file.getInputStream());
-
-            if (rootNode.isArray()) {
-                // JSON array format
-                List<Map<String, String>> records = new ArrayList<>();
-                for (JsonNode node : rootNode) {
-                    records.add(jsonNodeToMap(node));
-                }
-                return records.stream();
-            } else if (rootNode.isObject()) {
-                // Single JSON object
-                return Stream.of(jsonNodeToMap(rootNode));
-            } else {
-                throw new IllegalArgumentException(
-                        "JSON must be an array of objects or a single object");
-            }
-        } catch (IOException e) {
-            // Try parsing as NDJSON (newline-delimited JSON)
-            log.info("Attempting to parse as NDJSON format");
-            return parseNdjsonStream(reader);
+            values = objectMapper.readerFor(Object.class).readValues(jsonParser);
+        } catch (IOException | RuntimeException e) {
+            jsonParser.close();
+            throw e;
         }
-    }
 
-    /**
-     * Parse NDJSON (newline-delimited JSON) format
-     */
-    private Stream<Map<String, String>> parseNdjsonStream(BufferedReader reader) {
-        return reader.lines()
-                .filter(line -> line != null && !line.trim().isEmpty())
-                .map(line -> {
-                    try {
-                        JsonNode node = objectMapper.readTree(line);
-                        return jsonNodeToMap(node);
-                    } catch (IOException e) {
-                        log.error("Error parsing JSON line: {}", line, e);
-                        throw new RuntimeException(
-                                "Invalid JSON line: " + line.substring(0, Math.min(50, line.length())), e);
+        return StreamSupport.stream(
+                Spliterators.spliteratorUnknownSize(values, Spliterator.ORDERED), false)
+                .map(value -> {
+                    if (!(value instanceof Map)) {
+                        throw new IllegalArgumentException(
+                                "JSON must be an array of objects or a single object");
                     }
+                    @SuppressWarnings("unchecked")
+                    Map<String, Object> record = (Map<String, Object>) value;
+                    return jsonRecordToMap(record);
                 })
                 .onClose(() -> {
                     try {
-                        reader.close();
+                        values.close();
                     } catch (IOException e) {
-                        log.error("Error closing NDJSON reader", e);
+                        log.error("Error closing JSON parser", e);
                     }
                 });
     }
 
     /**
-     * Convert JsonNode to Map<String, String>
+     * Convert one decoded JSON object to Map<String, String>
      */
-    private Map<String, String> jsonNodeToMap(JsonNode node) {
-        Map<String, String> map = new HashMap<>();
-        Iterator<String> fieldNames = node.fieldNames();
-
-        while (fieldNames.hasNext()) {
-            String key = fieldNames.next();
-            JsonNode value = node.get(key);
-
-            if (value.isNull()) {
-                map.put(key, null);
-            } else if (value.isTextual()) {
-                map.put(key, value.asText());
+    private Map<String, String> jsonRecordToMap(Map<String, Object> record) {
+        Map<String, String> map = new HashMap<>(record.size() * 2);
+        for (Map.Entry<String, Object> field : record.entrySet()) {
+            Object value = field.getValue();
+            if (value == null) {
+                map.put(field.getKey(), null);
+            } else if (value instanceof String text) {
+                map.put(field.getKey(), text);
+            } else if (value instanceof Map || value instanceof List) {
+                map.put(field.getKey(), writeAsJson(value));
             } else {
-                map.put(key, value.toString());
+                map.put(field.getKey(), value.toString());
             }
         }
         return map;
     }
 
     /**
-     * Parse file based on its type
+     * Re-serialize a nested JSON value (object or array) to its text form
+     */
+    private String writeAsJson(Object value) {
+        try {
+            return objectMapper.writeValueAsString(value);
+        } catch (JsonProcessingException e) {
+            throw new IllegalArgumentException("Could not serialize nested JSON value", e);
+        }
+    }
+
+    /**
+     * Parse file based on its type.
+     * The upload is spooled to a temporary file first, so the multipart
+     * stream is consumed exactly once and parsing reads from local disk with
+     * flat memory regardless of upload size. The temporary file is removed
+     * when the returned stream is closed.
      */
     public Stream<Map<String, String>> parseFile(MultipartFile file) throws IOException {
         String fileType = detectFileType(file.getOriginalFilename());
+        log.debug("Parsing {} file: {}", fileType, file.getOriginalFilename());
 
-        if ("csv".equals(fileType)) {
-            return parseCsvStream(file);
-        } else if ("json".equals(fileType)) {
-            return parseJsonStream(file);
-        } else {
-            throw new IllegalArgumentException("Unsupported file type: " + fileType);
+        Path tempFile = Files.createTempFile("upload-", "." + fileType);
+        try {
+            file.transferTo(tempFile);
+            Stream<Map<String, String>> records = "csv".equals(fileType)
+                    ? parseCsvStream(tempFile)
+                    : parseJsonStream(tempFile);
+            return records.onClose(() -> deleteQuietly(tempFile));
+        } catch (IOException | RuntimeException e) {
+            deleteQuietly(tempFile);
+            throw e;
         }
     }
 
     /**
-     * Chunk records into batches for efficient processing
+     * Delete the temporary spool file, logging rather than failing on error
+     */
+    private void deleteQuietly(Path tempFile) {
+        try {
+            Files.deleteIfExists(tempFile);
+        } catch (IOException e) {
+            log.warn("Could not delete temporary upload file: {}", tempFile, e);
+        }
+    }
+
+    /**
+     * Chunk records into batches for efficient processing.
+     * Chunks are formed lazily as the returned stream is consumed, so only
+     * one chunk is materialized at a time regardless of file size. Closing
+     * the returned stream closes the source stream.
      */
     public <T> Stream<List<T>> chunkStream(Stream<T> stream, int chunkSize) {
-        Iterator<T> iterator = stream.iterator();
-        List<List<T>> chunks = new ArrayList<>();
+        Iterator<T> records = stream.iterator();
+        Iterator<List<T>> chunks = new Iterator<>() {
+            @Override
+            public boolean hasNext() {
+                return records.hasNext();
+            }
 
-        while (iterator.hasNext()) {
-            List<T> chunk = new ArrayList<>();
-            for (int i = 0; i < chunkSize && iterator.hasNext(); i++) {
-                chunk.add(iterator.next());
+            @Override
+            public List<T> next() {
+                if (!records.hasNext()) {
+                    throw new NoSuchElementException();
+                }
+                List<T> chunk = new ArrayList<>(chunkSize);
+                while (chunk.size() < chunkSize && records.hasNext()) {
+                    chunk.add(records.next());
+                }
+                return chunk;
             }
-            chunks.add(chunk);
-        }
+        };
 
-        return chunks.stream();
+        return StreamSupport.stream(
+                Spliterators.spliteratorUnknownSize(chunks, Spliterator.ORDERED), false)
+                .onClose(stream::close);
     }
 
     public int getChunkSize() {